@@ -17,33 +17,73 @@ Key Generative AI Infringement Cases in Media and Entertainment — McKool-only
 
 Requires:
   pip install requests beautifulsoup4
+Optional:
+  pip install orjson   (faster JSON encode/decode; stdlib json is used otherwise)
+  pip install lxml     (faster HTML parsing; html.parser is used otherwise)
+  pip install requests-cache   (persistent HTTP cache under .cache/)
 """
 
 import os
 import re
-import time
 import json
 import html
+import hashlib
+import shutil
+import sys
+import tempfile
+import logging
 import urllib.parse
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import orjson                  # optional: C encoder, byte-identical to json.dumps(indent=2)
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache          # optional: persistent HTTP cache with conditional revalidation
+except ImportError:
+    requests_cache = None
+
+try:
+    import lxml                    # noqa: F401  optional: C-backed tree builder for BeautifulSoup
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 # ==============================
 # Config & Constants
 # ==============================
 
+log = logging.getLogger("tracker")
+
 DOCS_DIR = "docs"
 INDEX_PATH = os.path.join(DOCS_DIR, "index.html")
 JSON_PATH = os.path.join(DOCS_DIR, "cases.json")
 
 HEADERS = {"User-Agent": "AI-Cases-Tracker/21.0 (+GitHub Pages/Actions)"}
+FETCH_RETRIES = 3
+RETRY_AFTER_MAX = 60.0      # seconds; one huge Retry-After must not stall the scheduled job
+
+# On-disk HTTP cache (used when requests-cache is installed); kept outside docs/ so it is never published
+HTTP_CACHE_PATH = os.path.join(".cache", "http_cache.sqlite")
+HTTP_CACHE_TTL = timedelta(hours=6)
+# Parsed McKool items, keyed by a digest of the article HTML plus this script (parser edits invalidate it)
+PARSE_CACHE_PATH = os.path.join(".cache", "mckool_parse.json")
 
 MCKOOL_INDEX = "https://www.mckoolsmith.com/newsroom-ailitigation"
 MCKOOL_BASE  = "https://www.mckoolsmith.com/"
 
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">, sniffed from raw bytes
+META_CHARSET_PAT = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_.:-]+)""", re.I)
+
 # Caption pattern like "X v Y" (or "X v. Y")
 CAPTION_PAT = re.compile(
     r"\b([A-Z][A-Za-z0-9\.\-’'& ]{1,90})\s+v\.?\s+([A-Z][A-Za-z0-9\.\-’'& ]{1,90})\b",
@@ -76,42 +116,148 @@ SUFFIX_PAT = re.compile(
     re.I
 )
 
+# Caption/party cleanup patterns (compiled once; used per caption side)
+V_SEP_PAT = re.compile(r"\s+v\.?\s+", re.I)
+V_DOT_SEP_PAT = re.compile(r"\s+v\.\s+", re.I)
+V_BARE_SEP_PAT = re.compile(r"\s+v\s+", re.I)
+BACKGROUND_TAIL_PAT = re.compile(r"\s*\bbackground\b\s*$", re.I)
+ET_AL_STRIP_PAT = re.compile(r"\s*,?\s*\bet\.?\s*al\.?\b\.?", re.I)
+ET_AL_PAT = re.compile(r"\bet\.?\s*al\.?\b", re.I)
+ET_AL_EXACT_PAT = re.compile(r"et\.?\s*al\.?", re.I)
+PARTY_SPLIT_PAT = re.compile(r"\s*,\s*|\s+&\s+|\s+and\s+", re.I)
+COMMA_PAT = re.compile(r"\s*,\s*")
+TRAIL_PUNCT_PAT = re.compile(r"\s*[,;:]+\s*$")
+TRAIL_PERIOD_PAT = re.compile(r"\s*\.\s*$")
+
+# McKool section structure: "<hN>1. Caption</hN>" followed by body siblings
+HEADING_TAG_PAT = re.compile(r"^h[1-6]$")
+NUMBERED_HEADING_PAT = re.compile(r"^\s*(\d+)\.\s*(.+)$")
+NUMBERED_START_PAT = re.compile(r"^\s*\d+\.\s+")
+NUMBERED_SPLIT_PAT = re.compile(r"(?m)^\s*\d+\.\s+")
+EDITION_URL_PAT = re.compile(r"/newsroom-ailitigation-(\d+)(?:/)?$")
+CURRENT_EDITION_PAT = re.compile(r"current\s*edition", re.I)
+STATUS_SECTION_PAT = re.compile(r"(?is)\bCurrent Status:\s*(.+?)(?:\n[A-Z][A-Za-z &]{2,30}:\s*|\Z)")
+BACKGROUND_SECTION_PAT = re.compile(r"(?is)\bBackground:\s*(.+?)(?:\n[A-Z][A-Za-z &]{2,30}:\s*|\Z)")
+SENTENCE_SPLIT_PAT = re.compile(r"(?<=[.!?])\s+")
+
+# The index page is only mined for edition links
+LINK_STRAINER = SoupStrainer("a", href=True)
+
+# Ruling/settlement probes shared by status inference and headlines
+SJ_GRANTED_PAT = re.compile(r"\b(granted|granting)\b.*\bsummary judgment\b|\bsummary judgment (granted|entered)\b")
+MTD_GRANTED_PAT = re.compile(r"\b(granted|granting)\b.*\bmotion to dismiss\b")
+MONEY_PAT = re.compile(r"\$\s?([0-9][\d\.,]+)\s*(billion|million|bn|m)?", re.I)
+
+# Keywords probed by status inference, headlines, takeaways and the publisher lens;
+# scanned once per section
+SECTION_KEYWORDS = (
+    "class certification", "class certified", "certify the class", "summary judgment",
+    "fair use", "judgment", "preliminary injunction", "permanent injunction", "injunction",
+    "preliminary", "permanent", "granted", "denied", "dismissed with prejudice",
+    "motion to dismiss", "dismissed", "dismisses", "settlement", "settled", "settle", "$",
+    "complaint filed", "new case", "filed on",
+    " rag ", "r.a.g", "southern district of new york", "robots", "terms of service", "trespass",
+)
+
+# Priority-ordered (alternatives, result) rules over keyword hits; a rule fires when every
+# keyword of any one alternative was seen.
+STATUS_RULES = (
+    ((("class certification",), ("class certified",), ("certify the class",)), ("Class certified", "Class Certification")),
+    ((("summary judgment",), ("fair use", "judgment")), ("Judgment", "Summary Judgment")),
+    ((("preliminary injunction",), ("permanent injunction",), ("injunction", "granted")), ("Injunction", "Injunction")),
+    ((("dismissed with prejudice",),), ("Dismissed", "Dismissal with prejudice")),
+    ((("mtd granted",), ("dismissed",)), ("Dismissed", "Dismissal")),
+    ((("settlement",), ("settled",), ("$", "settle")), ("Settled", "Settlement")),
+    ((("complaint filed",), ("new case",), ("filed on",)), ("Recently filed", "Update")),
+)
+TAKEAWAY_RULES = (
+    ((("fair use", "judgment"),), "Fair-use outcomes may hinge on record-specific market-harm proof."),
+    ((("settlement",), ("settled",)), "Settlement figures are emerging benchmarks for per-work valuation."),
+    ((("injunction",),), "Injunctive relief can impose output filters and retraining constraints."),
+)
+
+# Same mapping as html.escape(quote=True), applied in a single str.translate pass
+HTML_ESC_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
 # ==============================
 # Helpers
 # ==============================
 
+def _esc(s: str) -> str:
+    return (s or "").translate(HTML_ESC_TABLE)
+
 def format_us_date(dt: datetime) -> str:
     month = dt.strftime("%B")
     return f"{month} {dt.day}, {dt.year}"
 
-def fetch(url: str) -> str:
-    for i in range(4):
-        r = requests.get(url, headers=HEADERS, timeout=45)
-        if r.status_code == 200:
-            return r.text
-        if r.status_code in (429, 503):
-            time.sleep(2 + 2*i)
-            continue
-        r.raise_for_status()
-    raise RuntimeError(f"Failed to fetch {url}")
+class CappedRetry(Retry):
+    """urllib3 Retry that honors Retry-After but never sleeps longer than RETRY_AFTER_MAX."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+def make_session() -> requests.Session:
+    """
+    One pooled keep-alive session; both McKool requests hit the same host and reuse its TLS connection.
+    urllib3 retries connect/read errors and 429/503 with exponential backoff, honoring a capped Retry-After.
+    With requests-cache installed, responses persist in HTTP_CACHE_PATH between runs.
+    """
+    if requests_cache is not None:
+        # Honors Cache-Control/ETag; serves the last good copy if McKool errors out
+        sess = requests_cache.CachedSession(
+            HTTP_CACHE_PATH, backend="sqlite", expire_after=HTTP_CACHE_TTL,
+            cache_control=True, stale_if_error=True,
+        )
+    else:
+        sess = requests.Session()
+    sess.headers.update(HEADERS)
+    retries = CappedRetry(
+        total=FETCH_RETRIES,
+        backoff_factor=1,
+        status_forcelist=(429, 503),
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,          # hand the last response back so raise_for_status reports it
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    return sess
+
+SESSION = make_session()
 
+def fetch(url: str) -> str:
+    r = SESSION.get(url, timeout=45)
+    r.raise_for_status()
+    if "charset=" not in r.headers.get("Content-Type", "").lower():
+        # No header charset: honor the page's own <meta charset>, else decode as UTF-8
+        # instead of sniffing or the ISO-8859-1 text/* default
+        m = META_CHARSET_PAT.search(r.content[:4096])
+        r.encoding = m.group(1).decode("ascii") if m else "utf-8"
+    return r.text
+
+@lru_cache(maxsize=8192)
 def shorten_party(name: str) -> str:
     """Remove corporate suffixes and tidy spaces/punctuation, including dangling punctuation."""
     s = (name or "").strip()
-    s = re.sub(r"\s*,\s*", ", ", s)                 # normalize commas
-    s = re.sub(SUFFIX_PAT, "", s)                   # drop Inc., LLC, etc.
-    s = re.sub(r"\s+", " ", s).strip()              # collapse spaces
-    s = re.sub(r"\s*[,;:]+\s*$", "", s)             # drop trailing commas/semicolons/colons
-    s = re.sub(r"\s*\.\s*$", "", s)                 # drop trailing period
+    s = COMMA_PAT.sub(", ", s)                      # normalize commas
+    s = SUFFIX_PAT.sub("", s)                       # drop Inc., LLC, etc.
+    s = " ".join(s.split())                         # collapse spaces
+    s = TRAIL_PUNCT_PAT.sub("", s)                  # drop trailing commas/semicolons/colons
+    s = TRAIL_PERIOD_PAT.sub("", s)                 # drop trailing period
     return s
 
 def find_named_parties_in_text(text: str, candidates: list[str]) -> list[str]:
-    t = text or ""
+    # Lowercase once and probe literals with str.find; party names need no regex machinery
+    t = (text or "").lower()
     hits = []
     for name in candidates:
-        m = re.search(re.escape(name), t, re.I)
-        if m:
-            hits.append((m.start(), name))
+        pos = t.find(name.lower())
+        if pos >= 0:
+            hits.append((pos, name))
     hits.sort(key=lambda x: x[0])
     seen = set()
     ordered = []
@@ -123,33 +269,29 @@ def find_named_parties_in_text(text: str, candidates: list[str]) -> list[str]:
     return ordered
 
 def _split_parties(side: str) -> list[str]:
-    parts = re.split(r"\s*,\s*|\s+&\s+|\s+and\s+", (side or "").strip(), flags=re.I)
-    parts = [p for p in parts if p and not re.fullmatch(r"(?i)et\.?\s*al\.?", p.strip())]
-    return parts
+    parts = PARTY_SPLIT_PAT.split((side or "").strip())
+    return [p for p in parts if p and not ET_AL_EXACT_PAT.fullmatch(p.strip())]
 
+@lru_cache(maxsize=1024)
 def compress_caption(caption: str) -> str:
     """
     Base normalizer: keep left/right, strip 'Background', remove 'et al.' WITH adjacent punct,
     ensure ' v. ' with a period.
     """
-    cap = caption or ""
-    cap = re.sub(r"\s+v\.?\s+", " v. ", cap, flags=re.I)
-
-    m = re.search(r"\s+v\.\s+", cap, flags=re.I)
-    if not m:
+    # After normalization every separator is exactly " v. ", so a plain partition splits it
+    cap = V_SEP_PAT.sub(" v. ", caption or "")
+    left_raw, sep, right_raw = cap.partition(" v. ")
+    if not sep:
         return cap.strip()
-    left_raw, right_raw = cap[:m.start()], cap[m.end():]
-
-    # Remove trailing "Background" noise
-    left_raw = re.sub(r"(?i)\s*\bbackground\b\s*$", "", left_raw).strip()
-    right_raw = re.sub(r"(?i)\s*\bbackground\b\s*$", "", right_raw).strip()
 
-    # Remove 'et al.' and surrounding punctuation (pre-comma and trailing period)
-    left_raw = re.sub(r"(?i)\s*,?\s*\bet\.?\s*al\.?\b\.?", "", left_raw).strip()
-    right_raw = re.sub(r"(?i)\s*,?\s*\bet\.?\s*al\.?\b\.?", "", right_raw).strip()
+    def clean_side(side: str) -> str:
+        # Remove trailing "Background" noise, then 'et al.' with adjacent punctuation
+        side = BACKGROUND_TAIL_PAT.sub("", side).strip()
+        side = ET_AL_STRIP_PAT.sub("", side).strip()
+        return shorten_party(side)
 
-    left = shorten_party(left_raw)
-    right = shorten_party(right_raw)
+    left = clean_side(left_raw)
+    right = clean_side(right_raw)
 
     # Guard against blanks
     if not left:
@@ -167,7 +309,7 @@ def refine_caption(caption: str, block_text: str) -> str:
       - Clean dangling punctuation again
     """
     cap = caption or ""
-    m = re.search(r"\s+v\.\s+", cap, flags=re.I)
+    m = V_DOT_SEP_PAT.search(cap)
     if not m:
         return shorten_party(cap)
 
@@ -177,11 +319,11 @@ def refine_caption(caption: str, block_text: str) -> str:
     right_parts = _split_parties(right)
     needs_refine_right = (
         not right or len(right_parts) == 0 or len(right_parts) > 2 or
-        re.search(r"(?i)\bet\.?\s*al\.?\b", right) is not None
+        ET_AL_PAT.search(right) is not None
     )
     needs_refine_left = (
         not left or left.lower() in ("plaintiffs", "petitioners") or
-        re.search(r"(?i)\bet\.?\s*al\.?\b", left) is not None
+        ET_AL_PAT.search(left) is not None
     )
 
     # Rebuild right from text if needed
@@ -213,65 +355,77 @@ def refine_caption(caption: str, block_text: str) -> str:
     return f"{left} v. {right}"
 
 def smart_sentence(ctx: str) -> str:
-    sents = re.split(r"(?<=[.!?])\s+", ctx or "")
+    sents = SENTENCE_SPLIT_PAT.split(ctx or "")
     prefs = (" sued ", " files ", " filed ", " alleges ", " rules ", " granted ", " dismissed ",
              " injunction ", "certif", "settle", "summary judgment", "motion")
     for s in sents:
         ss = " " + s.lower() + " "
         if any(p in ss for p in prefs) and 44 <= len(s) <= 360:
             return s.strip()
-    out, take = [], 0
+    # Up to 3 sentences / ~420 chars; track the joined length instead of re-joining each step
+    out, joined_len = [], -1
     for s in sents:
-        if not s.strip():
+        s = s.strip()
+        if not s:
             continue
-        out.append(s.strip())
-        take += 1
-        if take >= 3 or len(" ".join(out)) >= 420:
+        out.append(s)
+        joined_len += len(s) + 1
+        if len(out) >= 3 or joined_len >= 420:
             break
     return " ".join(out) if out else (ctx or "")[:240].strip()
 
-def infer_status_outcome(text: str):
-    t = (text or "").lower()
-    if "class certification" in t or "class certified" in t or "certify the class" in t:
-        return ("Class certified", "Class Certification")
-    if "summary judgment" in t or ("fair use" in t and "judgment" in t):
-        return ("Judgment", "Summary Judgment")
-    if "preliminary injunction" in t or "permanent injunction" in t or ("injunction" in t and "granted" in t):
-        return ("Injunction", "Injunction")
-    if "dismissed with prejudice" in t:
-        return ("Dismissed", "Dismissal with prejudice")
-    if re.search(r"\b(granted|granting)\b.*\bmotion to dismiss\b", t):
-        return ("Dismissed", "Dismissal")
-    if "dismissed" in t:
-        return ("Dismissed", "Dismissal")
-    if "settlement" in t or "settled" in t or ("$" in t and "settle" in t):
-        return ("Settled", "Settlement")
-    if "complaint filed" in t or "new case" in t or "filed on" in t or "new case alert" in t:
-        return ("Recently filed", "Update")
-    return ("Open/Active", "Update")
-
-def headline_for(caption: str, ctx: str) -> str:
-    t = (ctx or "").lower()
-    if re.search(r"\b(granted|granting)\b.*\bsummary judgment\b|\bsummary judgment (granted|entered)\b", t) or ("fair use" in t and "judgment" in t):
+NO_HITS = frozenset()
+
+def keyword_hits(text_lc: str) -> frozenset:
+    """SECTION_KEYWORDS present in already-lowercased text; one sweep, then set probes per rule."""
+    hits = {k for k in SECTION_KEYWORDS if k in text_lc}
+    if "motion to dismiss" in hits and MTD_GRANTED_PAT.search(text_lc):
+        hits.add("mtd granted")
+    return frozenset(hits)
+
+def first_rule(rules, hits: frozenset, default):
+    for alternatives, result in rules:
+        if any(all(k in hits for k in req) for req in alternatives):
+            return result
+    return default
+
+# Rule verdicts depend only on the hit set, and most sections share a handful of distinct sets
+@lru_cache(maxsize=256)
+def status_outcome_for(hits: frozenset):
+    return first_rule(STATUS_RULES, hits, ("Open/Active", "Update"))
+
+def infer_status_outcome(text: str, hits: frozenset | None = None):
+    h = keyword_hits((text or "").lower()) if hits is None else hits
+    return status_outcome_for(h)
+
+@lru_cache(maxsize=256)
+def generic_takeaway_for(hits: frozenset) -> str:
+    return first_rule(TAKEAWAY_RULES, hits, "")
+
+@lru_cache(maxsize=1024)
+def headline_for(caption: str, ctx: str, hits: frozenset | None = None) -> str:
+    h = keyword_hits((ctx or "").lower()) if hits is None else hits
+    if ("summary judgment" in h and SJ_GRANTED_PAT.search((ctx or "").lower())) or ("fair use" in h and "judgment" in h):
         return f"{caption} - rules AI training fair use."
-    if "class certification" in t or "class certified" in t:
+    if "class certification" in h or "class certified" in h:
         return f"{caption} - certifies class in AI/IP case."
-    if "injunction" in t and ("granted" in t or "preliminary" in t or "permanent" in t):
+    if "injunction" in h and ("granted" in h or "preliminary" in h or "permanent" in h):
         return f"{caption} - injunction regarding AI use."
-    if "settle" in t or "settlement" in t:
-        m = re.search(r"\$\s?([0-9][\d\.,]+)\s*(billion|million|bn|m)?", ctx or "", re.I)
+    if "settle" in h:
+        m = MONEY_PAT.search(ctx or "")
         if m:
             amt = m.group(0)
             return f"{caption} - settlement ({amt})."
-    if "motion to dismiss" in t and not ("granted" in t or "denied" in t):
+    if "motion to dismiss" in h and not ("granted" in h or "denied" in h):
         return f"{caption} - motion to dismiss briefing."
-    if "dismissed" in t or "dismisses" in t:
+    if "dismissed" in h or "dismisses" in h:
         return f"{caption} - dismisses AI/IP claims."
     return caption
 
-def music_publisher_lens(caption: str, status_text: str, background_text: str) -> str:
+@lru_cache(maxsize=2048)
+def music_publisher_lens(caption: str, hits: frozenset) -> str:
+    """hits: keyword_hits() of the section's status + background text."""
     cap = (caption or "").lower()
-    txt = f"{status_text or ''} {background_text or ''}".lower()
 
     if "bartz" in cap and "anthropic" in cap:
         return ("Settlement magnitude (~$3k/work) is a valuation anchor. "
@@ -301,7 +455,7 @@ def music_publisher_lens(caption: str, status_text: str, background_text: str) -
         return ("Preservation obligations may unlock ingestion and output logs. "
                 "Request parallel preservation and model-audit protocols in music cases to surface lyric/composition usage and quantify market harm.")
 
-    if "perplexity" in cap or " rag " in txt or "r.a.g" in txt:
+    if "perplexity" in cap or " rag " in hits or "r.a.g" in hits:
         return ("RAG systems pose ongoing reproduction risks. "
                 "Assert claims on output reproduction of lyrics and require link-respecting behavior; consider negotiating paid access APIs for lyric metadata as an alternative.")
 
@@ -313,17 +467,17 @@ def music_publisher_lens(caption: str, status_text: str, background_text: str) -
         return ("Visual-art rulings on inducement and output similarity can carry over: "
                 "document AI outputs that recreate lyric structure/phrases to support composition claims and push for output filtering obligations.")
 
-    if "mdl" in cap or "multi-district" in cap or "southern district of new york" in txt:
+    if "mdl" in cap or "multi-district" in cap or "southern district of new york" in hits:
         return ("Coordinate with aligned plaintiffs; file amicus on market-harm factors relevant to compositions. "
                 "Track scheduling to time publisher filings with key expert discovery milestones.")
 
-    if "summary judgment" in txt and "fair use" in txt:
+    if "summary judgment" in hits and "fair use" in hits:
         return ("Anticipate fair-use defenses: center evidence on market substitution for compositions (lyrics/sheet music) rather than separate 'training-license' markets.")
-    if "injunction" in txt:
+    if "injunction" in hits:
         return ("Seek injunction terms that require dataset disclosure and output filters for lyrics; tie relief to retraining constraints if compositions were ingested.")
-    if "settlement" in txt or "settled" in txt or "$" in txt:
+    if "settlement" in hits or "settled" in hits or "$" in hits:
         return ("Use settlement figures to benchmark per-work valuation; pursue early settlement conferences backed by provenance audits and catalog-specific damages models.")
-    if "robots" in txt or "terms of service" in txt or "trespass" in txt:
+    if "robots" in hits or "terms of service" in hits or "trespass" in hits:
         return ("Strengthen site TOS and robots.txt for lyrics; maintain detailed access logs to support contract and anti-circumvention claims.")
 
     return ("Build evidentiary files on lyric/composition market harm (lost sync, sheet music, lyric licensing) and compel disclosure of training datasets and ingestion logs.")
@@ -333,12 +487,15 @@ def music_publisher_lens(caption: str, status_text: str, background_text: str) -
 # ==============================
 
 def mckool_find_latest_url(index_html: str) -> str:
-    soup = BeautifulSoup(index_html, "html.parser")
+    soup = BeautifulSoup(index_html, HTML_PARSER, parse_only=LINK_STRAINER)
     best_href, best_n = None, -1
     for a in soup.find_all("a", href=True):
         href = a["href"].strip()
+        # Cheap substring reject before urljoin; the base URL never contributes this marker
+        if "newsroom-ailitigation-" not in href:
+            continue
         abs_href = urljoin(MCKOOL_BASE, href)
-        m = re.search(r"/newsroom-ailitigation-(\d+)(?:/)?$", abs_href)
+        m = EDITION_URL_PAT.search(abs_href)
         if not m:
             continue
         n = int(m.group(1))
@@ -352,19 +509,29 @@ def mckool_find_latest_url(index_html: str) -> str:
             return urljoin(MCKOOL_BASE, a["href"].strip())
     return MCKOOL_INDEX
 
-def extract_as_of_date(article_soup: BeautifulSoup, raw_html: str) -> str:
+def text_prefix(node, limit: int) -> str:
+    """Same as node.get_text("\\n", strip=True)[:limit], but stops walking once enough text is seen."""
+    parts, total = [], 0
+    for s in node.stripped_strings:
+        parts.append(s)
+        total += len(s) + 1
+        if total > limit:
+            break
+    return "\n".join(parts)[:limit]
+
+def extract_as_of_date(article_soup: BeautifulSoup, raw_html: str) -> str | None:
     def fmt_match(m) -> str:
         mm, dd, yyyy = map(int, m.groups())
         return format_us_date(datetime(yyyy, mm, dd))
 
-    anchor = re.search(r"current\s*edition", raw_html, re.I)
+    anchor = CURRENT_EDITION_PAT.search(raw_html)
     if anchor:
         tail = raw_html[anchor.end(): anchor.end() + 1200]
         m = DATE_NUM_FLEX_PAT.search(tail)
         if m:
             return fmt_match(m)
 
-    top_text = article_soup.get_text("\n", strip=True)[:3000]
+    top_text = text_prefix(article_soup, 3000)
     m2 = DATE_NUM_FLEX_PAT.search(top_text)
     if m2:
         return fmt_match(m2)
@@ -373,135 +540,67 @@ def extract_as_of_date(article_soup: BeautifulSoup, raw_html: str) -> str:
     if m3:
         return fmt_match(m3)
 
-    return format_us_date(datetime.utcnow())
-
-def mckool_parse_latest():
-    idx = fetch(MCKOOL_INDEX)
-    latest_url = mckool_find_latest_url(idx)
-    print(f"[McKool] latest URL picked: {latest_url}", flush=True)
-    article_html = fetch(latest_url)
-
-    soup = BeautifulSoup(article_html, "html.parser")
-    main = soup.find("main") or soup.find("article") or soup
-    as_of_date = extract_as_of_date(soup, article_html) or format_us_date(datetime.utcnow())
-
-    def text_of(node):
-        return html.unescape(node.get_text("\n", strip=True))
-
-    sections = []
-    headings = main.find_all(re.compile(r"^h[1-6]$"))
-    for h in headings:
-        title = text_of(h)
-        m = re.match(r"^\s*(\d+)\.\s*(.+)$", title)
-        if not m:
-            continue
-        caption_line = m.group(2).strip()
-
-        block_parts = []
-        sib = h.next_sibling
-        while sib:
-            if getattr(sib, "name", None) and re.match(r"^h[1-6]$", sib.name):
-                t2 = text_of(sib)
-                if re.match(r"^\s*\d+\.\s+", t2):
-                    break
-            if hasattr(sib, "get_text"):
-                block_parts.append(text_of(sib))
-            sib = getattr(sib, "next_sibling", None)
-        block_text = "\n".join([p for p in block_parts if p]).strip()
-        sections.append((caption_line, block_text))
-
-    if not sections:
-        text = text_of(main)
-        raw_blocks = re.split(r"(?m)^\s*\d+\.\s+", text)[1:]
-        for body in raw_blocks:
-            lines = body.split("\n")
-            caption_line = lines[0].strip()
-            block_text = "\n".join(lines[1:]).strip()
-            sections.append((caption_line, block_text))
-
-    print(f"[McKool] section count: {len(sections)}  url={latest_url}", flush=True)
-
-    items = []
-    for (caption_line, block_text) in sections:
-        # Normalize caption to "Left v. Right" (keep period in v.)
-        raw_caption = re.sub(r"\s+v\.\s+", " v. ", caption_line, flags=re.I)
-        raw_caption = re.sub(r"\s+v\s+", " v. ", raw_caption, flags=re.I)
-
-        mcap = CAPTION_PAT.search(raw_caption)
-        base_caption = compress_caption(mcap.group(0) if mcap else raw_caption.strip())
-
-        # Refine parties using text context (rebuild pairs like 'Microsoft & OpenAI')
-        caption = refine_caption(base_caption, block_text)
-
-        # Pull labeled segments
-        status_match = re.search(r"(?is)\bCurrent Status:\s*(.+?)(?:\n[A-Z][A-Za-z &]{2,30}:\s*|\Z)", block_text)
-        background_match = re.search(r"(?is)\bBackground:\s*(.+?)(?:\n[A-Z][A-Za-z &]{2,30}:\s*|\Z)", block_text)
-        status_text = (status_match.group(1).strip() if status_match else "")
-        background_text = (background_match.group(1).strip() if background_match else "")
-
-        lead = status_text or background_text or smart_sentence(block_text)
-        status, outcome = infer_status_outcome(status_text + " " + background_text)
-        headline = headline_for(caption, status_text + " " + background_text)
-
-        generic_takeaway = ""
-        t = (status_text + " " + background_text).lower()
-        if "fair use" in t and ("judgment" in t or "summary judgment" in t):
-            generic_takeaway = "Fair-use outcomes may hinge on record-specific market-harm proof."
-        elif "settlement" in t or "settled" in t:
-            generic_takeaway = "Settlement figures are emerging benchmarks for per-work valuation."
-        elif "injunction" in t:
-            generic_takeaway = "Injunctive relief can impose output filters and retraining constraints."
-
-        pub_lens = music_publisher_lens(caption, status_text, background_text)
-
-        summary_html = f"<b>Summaries:</b> <b>{html.escape(caption)}</b> — {html.escape(lead)}"
-        if generic_takeaway:
-            summary_html += "<br><br><b>Key takeaway:</b> " + html.escape(generic_takeaway)
-
-        src_url = courtlistener_search_url(caption, hint_text=status_text + " " + background_text)
-
-        items.append({
-            "title": caption,
-            "headline": headline,
-            "summary": summary_html,
-            "takeaway": "",
-            "music_lens": pub_lens,
-            "status": status,
-            "outcome": outcome,
-            "source": "",
-            "url": src_url,
-            "case_ref": "",
-            "date": as_of_date
-        })
-
-    print(f"[McKool] built {len(items)} items; as_of={as_of_date}", flush=True)
-    return items, as_of_date
+    # No printed date; the caller falls back to today (and skips the parse cache)
+    return None
 
 # ==============================
 # CourtListener search URL
 # ==============================
 
+# Court mentions (lowercase) -> CourtListener court filter; first matching row wins
+COURT_HINTS = (
+    (("n.d. cal", "northern district of california"), " AND (court:(california northern))"),
+    (("s.d.n.y.", "southern district of new york"), " AND (court:(new york southern))"),
+    (("d. mass", "district of massachusetts"), " AND (court:(massachusetts))"),
+    (("d. del", "district of delaware"), " AND (court:(delaware))"),
+)
+
 def courtlistener_search_url(caption: str, hint_text: str = "") -> str:
-    q = caption
-    hint = ""
     ht = (hint_text or "").lower()
-    if "n.d. cal" in ht or "northern district of california" in ht:
-        hint = " AND (court:(california northern))"
-    elif "s.d.n.y." in ht or "southern district of new york" in ht:
-        hint = " AND (court:(new york southern))"
-    elif "d. mass" in ht or "district of massachusetts" in ht:
-        hint = " AND (court:(massachusetts))"
-    elif "d. del" in ht or "district of delaware" in ht:
-        hint = " AND (court:(delaware))"
-    query = urllib.parse.quote_plus(q + hint)
+    hint = next((h for needles, h in COURT_HINTS if any(n in ht for n in needles)), "")
+    query = urllib.parse.quote_plus(caption + hint)
     return f"https://www.courtlistener.com/?q={query}&type=r&order_by=score%20desc"
 
 # ==============================
 # HTML UI
 # ==============================
 
-def build_index_html(as_of: str) -> str:
+def render_card(c: dict) -> str:
+    """One pre-rendered case card; summary is trusted HTML built by the scraper, other fields are text."""
+    status = c.get("status") or "Open/Active"
+    outcome = c.get("outcome") or ""
+    summary = c.get("summary") or "<b>Summaries:</b> No summary available."
+    # The search box matches these fields only (never the music lens or footer text), pre-lowercased
+    search = " ".join((c.get("headline") or c.get("title") or "", c.get("outcome") or "",
+                       c.get("source") or "", c.get("summary") or "", c.get("status") or "")).lower()
+    parts = [
+        f'<div class="card" data-title="{_esc((c.get("title") or "").lower())}"'
+        f' data-status="{_esc((c.get("status") or "").lower())}"'
+        f' data-source="{_esc((c.get("source") or "").lower())}"'
+        f' data-search="{_esc(search)}">',
+        f'<div class="title">{_esc(c.get("headline") or c.get("title") or "Case")}</div>',
+        f'<div class="meta"><span class="pill">{_esc(status)}</span>',
+    ]
+    if outcome and outcome != "Update":
+        parts.append(f'<span class="pill2">{_esc(outcome)}</span>')
+    if c.get("case_ref"):
+        parts.append(f'<span class="ref">Case ref: {_esc(c["case_ref"])}</span>')
+    parts.append(f'</div>\n<div class="summary">{summary}</div>')
+    if c.get("takeaway") and "<b>key takeaway:</b>" not in summary.lower():
+        parts.append(f'<div class="summary"><b>Key takeaway:</b> {_esc(c["takeaway"])}</div>')
+    if c.get("music_lens"):
+        parts.append(f'<div class="summary"><b>Music lens:</b> {_esc(c["music_lens"])}</div>')
+    parts.append(
+        f'<div class="footer"><span></span><a class="linkbtn" href="{_esc(c.get("url") or "#")}"'
+        ' target="_blank" rel="noopener">Source →</a></div></div>'
+    )
+    return "\n".join(parts)
+
+def build_index_html(as_of: str, items=()) -> str:
+    """Static page with every card rendered at build time; the inline script only filters and reorders."""
     as_of = as_of or format_us_date(datetime.utcnow())
+    cards = "\n".join(render_card(c) for c in items)
+    empty_style = ' style="display:none"' if items else ""
     return f"""<!doctype html>
 <html lang="en">
 <head>
@@ -554,81 +653,49 @@ def build_index_html(as_of: str) -> str:
     </select>
   </div>
 
-  <div id="list" class="grid"></div>
+  <div id="list" class="grid">
+<div id="empty" class="card"{empty_style}><div class="title">No cases found</div><div class="summary">Try clearing filters or check back later.</div></div>
+{cards}
+  </div>
 
 <script>
-async function load() {{
+(function() {{
   const list = document.getElementById('list');
-  try {{
-    const res = await fetch('cases.json', {{cache:'no-store'}});
-    if (!res.ok) throw new Error('Failed to load cases.json: ' + res.status);
-    const data = await res.json();
-
-    const q = document.getElementById('q');
-    const sortSel = document.getElementById('sort');
-    const statusSel = document.getElementById('status');
-
-    function render(filter='', sortBy='title', statusFilter='') {{
-      const f = filter.toLowerCase();
-      let items = data.filter(c => {{
-        const hay = (c.headline + ' ' + (c.outcome||'') + ' ' + (c.source||'') + ' ' + (c.summary||'') + ' ' + (c.status||'')).toLowerCase();
-        const passText = !f || hay.includes(f);
-        const passStatus = !statusFilter || (c.status||'').toLowerCase() === statusFilter.toLowerCase();
-        return passText && passStatus;
-      }});
-
-      items.sort((a,b)=>{{
-        const ax=(a[sortBy]||'').toString().toLowerCase();
-        const bx=(b[sortBy]||'').toString().toLowerCase();
-        return ax.localeCompare(bx);
-      }});
-
-      list.innerHTML = '';
-      items.forEach(c=>{{
-        const url = c.url || '#';
-        const status  = c.status || 'Open/Active';
-        const headline = (c.headline || c.title || 'Case');
-        const cref = c.case_ref ? `<span class="ref">Case ref: ${'{'}c.case_ref{'}'}</span>` : '';
-        const hasEmbeddedKT = (c.summary||"").toLowerCase().includes("<b>key takeaway:</b>");
-        const ktInline = (!hasEmbeddedKT && c.takeaway)
-          ? `<div class="summary"><b>Key takeaway:</b> ${'{'}c.takeaway{'}'}</div>`
-          : '';
-
-        const card = document.createElement('div');
-        card.className = 'card';
-        card.innerHTML = `
-          <div class="title">${'{'}headline{'}'}</div>
-          <div class="meta">
-            <span class="pill">${'{'}status{'}'}</span>
-            ${'{'}c.outcome && c.outcome !== 'Update' ? `<span class="pill2">${'{'}c.outcome{'}'}</span>` : ''{'}'}
-            ${'{'}cref{'}'}
-          </div>
-          <div class="summary">${'{'}c.summary || '<b>Summaries:</b> No summary available.'{'}'}</div>
-          ${'{'}ktInline{'}'}
-          ${'{'}c.music_lens ? `<div class="summary"><b>Music lens:</b> ${'{'}c.music_lens{'}'}</div>` : ''{'}'}
-          <div class="footer">
-            <span></span>
-            <a class="linkbtn" href="${'{'}url{'}'}" target="_blank" rel="noopener">Source →</a>
-          </div>
-        `;
-        list.appendChild(card);
-      }});
-
-      if (items.length === 0) {{
-        list.innerHTML = '<div class="card"><div class="title">No cases found</div><div class="summary">Try clearing filters or check back later.</div></div>';
-      }}
-    }}
-
-    q.addEventListener('input', (e)=>render(e.target.value, sortSel.value, statusSel.value));
-    sortSel.addEventListener('change', ()=>render(q.value, sortSel.value, statusSel.value));
-    statusSel.addEventListener('change', ()=>render(q.value, sortSel.value, statusSel.value));
-    render();
-  }} catch (e) {{
-    list.innerHTML = '<div class="card"><div class="title">Site is initializing</div><div class="summary">Could not load <code>cases.json</code>. Verify the Action wrote <code>docs/cases.json</code> and Pages is set to main /docs.</div></div>';
-    console.error(e);
+  const empty = document.getElementById('empty');
+  const q = document.getElementById('q');
+  const sortSel = document.getElementById('sort');
+  const statusSel = document.getElementById('status');
+  const cards = Array.from(list.querySelectorAll('.card[data-title]'));
+
+  function filter() {{
+    const f = q.value.toLowerCase();
+    const statusFilter = statusSel.value.toLowerCase();
+    let shown = 0;
+    cards.forEach(el => {{
+      const pass = (!f || el.dataset.search.includes(f)) && (!statusFilter || el.dataset.status === statusFilter);
+      el.style.display = pass ? '' : 'none';
+      if (pass) shown++;
+    }});
+    empty.style.display = shown ? 'none' : '';
+  }}
+
+  function sort() {{
+    const key = sortSel.value;
+    cards.sort((a,b) => (a.dataset[key]||'').localeCompare(b.dataset[key]||''));
+    // Move every card into one fragment so the grid reflows once, not once per card
+    const frag = document.createDocumentFragment();
+    cards.forEach(el => frag.appendChild(el));
+    list.appendChild(frag);
   }}
-}}
-load();
+
+  let pending = 0;
+  q.addEventListener('input', () => {{
+    clearTimeout(pending);
+    pending = setTimeout(filter, 120);
+  }});
+  statusSel.addEventListener('change', filter);
+  sortSel.addEventListener('change', sort);
+}})();
 </script>
 </body>
 </html>"""
@@ -637,94 +704,168 @@ load();
 # Output & Runner
 # ==============================
 
-def ensure_docs(as_of: str):
-    os.makedirs(DOCS_DIR, exist_ok=True)
-    with open(os.path.join(DOCS_DIR, ".nojekyll"), "w", encoding="utf-8") as f:
-        f.write("")
-    with open(INDEX_PATH, "w", encoding="utf-8") as f:
-        f.write(build_index_html(as_of))
-
-def mckool_parse_latest():
-    idx = fetch(MCKOOL_INDEX)
-    latest_url = mckool_find_latest_url(idx)
-    print(f"[McKool] latest URL picked: {latest_url}", flush=True)
-    article_html = fetch(latest_url)
+def _current_umask() -> int:
+    """Read the process umask (os.umask only reports it by setting it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
 
-    soup = BeautifulSoup(article_html, "html.parser")
-    main = soup.find("main") or soup.find("article") or soup
-    as_of_date = extract_as_of_date(soup, article_html) or format_us_date(datetime.utcnow())
-
-    def text_of(node):
-        return html.unescape(node.get_text("\n", strip=True))
+def write_if_changed(path: str, data: bytes) -> bool:
+    """Write bytes to path unless the file already holds exactly them (avoids no-op diffs/Pages rebuilds)."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    # Write beside the target and swap in, so a crash never leaves a truncated file in docs/
+    f = tempfile.NamedTemporaryFile(dir=os.path.dirname(path) or ".", prefix=".tmp-", delete=False)
+    tmp = f.name
+    try:
+        with f:
+            f.write(data)
+        # NamedTemporaryFile is 0600; give the swapped-in file the target's mode (or the umask default)
+        try:
+            shutil.copymode(path, tmp)
+        except FileNotFoundError:
+            os.chmod(tmp, 0o666 & ~_current_umask())
+        os.replace(tmp, path)
+    except BaseException:
+        # Never leave the temp file behind for the workflow's `git add docs/` to publish
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return True
+
+def dump_json_bytes(items) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(items, option=orjson.OPT_INDENT_2)
+    return json.dumps(items, ensure_ascii=False, indent=2).encode("utf-8")
+
+def load_json_bytes(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def parse_cache_digest(article_html: str) -> str:
+    h = hashlib.blake2b(article_html.encode("utf-8"), digest_size=16)
+    with open(__file__, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+def load_parse_cache(digest: str):
+    """Return the cached (items, as_of) for digest, or None on a miss or unreadable cache."""
+    try:
+        with open(PARSE_CACHE_PATH, "rb") as f:
+            cached = load_json_bytes(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("hash") != digest or not cached.get("as_of"):
+        return None
+    return cached.get("items", []), cached["as_of"]
+
+def save_parse_cache(digest: str, items, as_of: str):
+    try:
+        os.makedirs(os.path.dirname(PARSE_CACHE_PATH), exist_ok=True)
+        write_if_changed(PARSE_CACHE_PATH, dump_json_bytes({"hash": digest, "as_of": as_of, "items": items}))
+    except OSError as e:
+        log.warning("[McKool] could not write parse cache: %s", e)
 
-    sections = []
-    headings = main.find_all(re.compile(r"^h[1-6]$"))
-    for h in headings:
-        title = text_of(h)
-        m = re.match(r"^\s*(\d+)\.\s*(.+)$", title)
+def ensure_docs(as_of: str, items=()):
+    os.makedirs(DOCS_DIR, exist_ok=True)
+    nojekyll = os.path.join(DOCS_DIR, ".nojekyll")
+    if not os.path.exists(nojekyll):
+        with open(nojekyll, "w", encoding="utf-8") as f:
+            f.write("")
+    write_if_changed(INDEX_PATH, build_index_html(as_of, items).encode("utf-8"))
+
+def iter_mckool_sections(main):
+    """Yield (caption_line, block_text) per numbered section, lazily; falls back to splitting plain text."""
+    found = False
+    for h in main.find_all(HEADING_TAG_PAT):
+        # Match on raw text; only numbered section headings pay for unescaping
+        m = NUMBERED_HEADING_PAT.match(h.get_text("\n", strip=True))
         if not m:
             continue
-        caption_line = m.group(2).strip()
+        caption_line = html.unescape(m.group(2)).strip()
 
+        # Collect raw sibling text once per node; unescape the joined block once
         block_parts = []
         sib = h.next_sibling
         while sib:
-            if getattr(sib, "name", None) and re.match(r"^h[1-6]$", sib.name):
-                t2 = text_of(sib)
-                if re.match(r"^\s*\d+\.\s+", t2):
-                    break
             if hasattr(sib, "get_text"):
-                block_parts.append(text_of(sib))
+                part = sib.get_text("\n", strip=True)
+                if getattr(sib, "name", None) and HEADING_TAG_PAT.match(sib.name):
+                    if NUMBERED_START_PAT.match(part):
+                        break
+                if part:
+                    block_parts.append(part)
             sib = getattr(sib, "next_sibling", None)
-        block_text = "\n".join([p for p in block_parts if p]).strip()
-        sections.append((caption_line, block_text))
+        found = True
+        yield caption_line, html.unescape("\n".join(block_parts)).strip()
 
-    if not sections:
-        text = text_of(main)
-        raw_blocks = re.split(r"(?m)^\s*\d+\.\s+", text)[1:]
-        for body in raw_blocks:
-            lines = body.split("\n")
-            caption_line = lines[0].strip()
-            block_text = "\n".join(lines[1:]).strip()
-            sections.append((caption_line, block_text))
+    if found:
+        return
+    text = html.unescape(main.get_text("\n", strip=True))
+    for body in NUMBERED_SPLIT_PAT.split(text)[1:]:
+        lines = body.split("\n")
+        yield lines[0].strip(), "\n".join(lines[1:]).strip()
 
-    print(f"[McKool] section count: {len(sections)}  url={latest_url}", flush=True)
+def mckool_parse_latest():
+    idx = fetch(MCKOOL_INDEX)
+    latest_url = mckool_find_latest_url(idx)
+    log.info("[McKool] latest URL picked: %s", latest_url)
+    article_html = fetch(latest_url)
 
-    items = []
-    for (caption_line, block_text) in sections:
-        raw_caption = re.sub(r"\s+v\.\s+", " v. ", caption_line, flags=re.I)
-        raw_caption = re.sub(r"\s+v\s+", " v. ", raw_caption, flags=re.I)
+    digest = parse_cache_digest(article_html)
+    cached = load_parse_cache(digest)
+    if cached is not None:
+        items, as_of_date = cached
+        log.info("[McKool] article unchanged; reusing %d cached items; as_of=%s", len(items), as_of_date)
+        return items, as_of_date
+
+    # Parse the whole page: section bodies include loose text and arbitrary tags between headings
+    soup = BeautifulSoup(article_html, HTML_PARSER)
+    main = soup.find("main") or soup.find("article") or soup
+    printed_date = extract_as_of_date(soup, article_html)
+    as_of_date = printed_date or format_us_date(datetime.utcnow())
 
-        mcap = CAPTION_PAT.search(raw_caption)
+    items = []
+    section_count = 0
+    for (caption_line, block_text) in iter_mckool_sections(main):
+        section_count += 1
+        raw_caption = V_DOT_SEP_PAT.sub(" v. ", caption_line)
+        raw_caption = V_BARE_SEP_PAT.sub(" v. ", raw_caption)
+
+        # Both separator passes leave " v. " wherever CAPTION_PAT could match; skip the regex otherwise
+        mcap = CAPTION_PAT.search(raw_caption) if " v. " in raw_caption else None
         base_caption = compress_caption(mcap.group(0) if mcap else raw_caption.strip())
 
         caption = refine_caption(base_caption, block_text)
 
-        status_match = re.search(r"(?is)\bCurrent Status:\s*(.+?)(?:\n[A-Z][A-Za-z &]{2,30}:\s*|\Z)", block_text)
-        background_match = re.search(r"(?is)\bBackground:\s*(.+?)(?:\n[A-Z][A-Za-z &]{2,30}:\s*|\Z)", block_text)
+        status_match = STATUS_SECTION_PAT.search(block_text)
+        background_match = BACKGROUND_SECTION_PAT.search(block_text)
         status_text = (status_match.group(1).strip() if status_match else "")
         background_text = (background_match.group(1).strip() if background_match else "")
 
         lead = status_text or background_text or smart_sentence(block_text)
-        status, outcome = infer_status_outcome(status_text + " " + background_text)
-        headline = headline_for(caption, status_text + " " + background_text)
-
-        generic_takeaway = ""
-        t = (status_text + " " + background_text).lower()
-        if "fair use" in t and ("judgment" in t or "summary judgment" in t):
-            generic_takeaway = "Fair-use outcomes may hinge on record-specific market-harm proof."
-        elif "settlement" in t or "settled" in t:
-            generic_takeaway = "Settlement figures are emerging benchmarks for per-work valuation."
-        elif "injunction" in t:
-            generic_takeaway = "Injunctive relief can impose output filters and retraining constraints."
+        ctx = status_text + " " + background_text
+        ctx_lc = ctx.lower()
+        # Sections without labeled status/background text cannot hit any keyword
+        hits = keyword_hits(ctx_lc) if (status_text or background_text) else NO_HITS
+        status, outcome = infer_status_outcome(ctx, hits)
+        headline = headline_for(caption, ctx, hits)
+        generic_takeaway = generic_takeaway_for(hits)
 
-        pub_lens = music_publisher_lens(caption, status_text, background_text)
+        pub_lens = music_publisher_lens(caption, hits)
 
-        summary_html = f"<b>Summaries:</b> <b>{html.escape(caption)}</b> — {html.escape(lead)}"
+        summary_html = f"<b>Summaries:</b> <b>{_esc(caption)}</b> — {_esc(lead)}"
         if generic_takeaway:
-            summary_html += "<br><br><b>Key takeaway:</b> " + html.escape(generic_takeaway)
+            summary_html += "<br><br><b>Key takeaway:</b> " + _esc(generic_takeaway)
 
-        src_url = courtlistener_search_url(caption, hint_text=status_text + " " + background_text)
+        src_url = courtlistener_search_url(caption, hint_text=ctx)
 
         items.append({
             "title": caption,
@@ -740,26 +881,30 @@ def mckool_parse_latest():
             "date": as_of_date
         })
 
-    print(f"[McKool] built {len(items)} items; as_of={as_of_date}", flush=True)
+    log.info("[McKool] section count: %d  url=%s", section_count, latest_url)
+    log.info("[McKool] built %d items; as_of=%s", len(items), as_of_date)
+    # Only dated editions are cached; an undated page falls back to today and must be re-derived
+    if printed_date:
+        save_parse_cache(digest, items, as_of_date)
     return items, as_of_date
 
 def run():
-    print("[tracker] pulling latest McKool edition (publisher-focused)", flush=True)
+    log.info("[tracker] pulling latest McKool edition (publisher-focused)")
     try:
         items, as_of = mckool_parse_latest()
     except Exception as e:
-        print(f"[McKool] ERROR: {e}", flush=True)
+        log.error("[McKool] ERROR: %s", e)
         items, as_of = [], format_us_date(datetime.utcnow())
 
     if not as_of:
         as_of = format_us_date(datetime.utcnow())
 
     items = sorted(items, key=lambda x: x["title"].lower())
-    ensure_docs(as_of)
-    with open(JSON_PATH, "w", encoding="utf-8") as f:
-        json.dump(items, f, ensure_ascii=False, indent=2)
+    ensure_docs(as_of, items)
+    write_if_changed(JSON_PATH, dump_json_bytes(items))
 
-    print(f"[tracker] wrote {JSON_PATH} with {len(items)} items; index subtitle 'as of {as_of}'", flush=True)
+    log.info("[tracker] wrote %s with %d items; index subtitle 'as of %s'", JSON_PATH, len(items), as_of)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     run()